@@ -49,7 +49,7 @@ from browser_use.browser.views import (
 )
 from browser_use.dom.clickable_element_processor.service import ClickableElementProcessor
 from browser_use.dom.service import DomService
-from browser_use.dom.views import DOMElementNode, SelectorMap
+from browser_use.dom.views import DOMBaseNode, DOMElementNode, SelectorMap
 from browser_use.utils import match_url_with_domain_pattern, merge_dicts, retry, time_execution_async, time_execution_sync
 
 _GLOB_WARNING_SHOWN = False  # used inside _is_url_allowed to avoid spamming the logs with the same warning multiple times
@@ -62,6 +62,84 @@ GLOBAL_PATCHRIGHT_EVENT_LOOP = None  # track which event loop the global objects
 MAX_SCREENSHOT_HEIGHT = 2000
 MAX_SCREENSHOT_WIDTH = 1920
 
+# used by _enhanced_css_selector_for_element, built once at import instead of on every call
+CSS_VALID_CLASS_NAME_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_-]*$')
+CSS_WHITESPACE_RE = re.compile(r'\s+')
+# Expanded set of safe attributes that are stable and useful for selection
+CSS_SELECTOR_SAFE_ATTRIBUTES = frozenset(
+	{
+		# Data attributes (if they're stable in your application)
+		'id',
+		# Standard HTML attributes
+		'name',
+		'type',
+		'placeholder',
+		# Accessibility attributes
+		'aria-label',
+		'aria-labelledby',
+		'aria-describedby',
+		'role',
+		# Common form attributes
+		'for',
+		'autocomplete',
+		'required',
+		'readonly',
+		# Media attributes
+		'alt',
+		'title',
+		'src',
+		# Custom stable attributes (add any application-specific ones)
+		'href',
+		'target',
+	}
+)
+CSS_SELECTOR_SAFE_AND_DYNAMIC_ATTRIBUTES = CSS_SELECTOR_SAFE_ATTRIBUTES | {'data-id', 'data-qa', 'data-cy', 'data-testid'}
+
+# used by _wait_for_stable_network to decide which requests count as page load activity, built once at import
+NETWORK_RELEVANT_RESOURCE_TYPES = frozenset({'document', 'stylesheet', 'image', 'font', 'script', 'iframe'})
+NETWORK_RELEVANT_CONTENT_TYPES = ('text/html', 'text/css', 'application/javascript', 'image/', 'font/', 'application/json')
+# content types of streaming / real-time responses
+NETWORK_STREAMING_CONTENT_TYPES = ('streaming', 'video', 'audio', 'webm', 'mp4', 'event-stream', 'websocket', 'protobuf')
+# Additional patterns to filter out
+NETWORK_IGNORED_URL_PATTERNS = (
+	# Analytics and tracking
+	'analytics',
+	'tracking',
+	'telemetry',
+	'beacon',
+	'metrics',
+	# Ad-related
+	'doubleclick',
+	'adsystem',
+	'adserver',
+	'advertising',
+	# Social media widgets
+	'facebook.com/plugins',
+	'platform.twitter',
+	'linkedin.com/embed',
+	# Live chat and support
+	'livechat',
+	'zendesk',
+	'intercom',
+	'crisp.chat',
+	'hotjar',
+	# Push notifications
+	'push-notifications',
+	'onesignal',
+	'pushwoosh',
+	# Background sync/heartbeat
+	'heartbeat',
+	'ping',
+	'alive',
+	# WebRTC and streaming
+	'webrtc',
+	'rtmp://',
+	'wss://',
+	# Common CDNs for dynamic content
+	'cloudfront.net',
+	'fastly.net',
+)
+
 
 def _log_glob_warning(domain: str, glob: str, logger: logging.Logger):
 	global _GLOB_WARNING_SHOWN
@@ -1333,21 +1411,24 @@ class BrowserSession(BaseModel):
 
 		# Set up visibility listeners for all existing tabs
 		# self.logger.info(f'Setting up visibility listeners for {len(self.browser_context.pages)} pages')
-		for page in self.browser_context.pages:
-			# self.logger.info(f'Processing page with URL: {repr(page.url)}')
-			# Skip about:blank pages as they can hang when evaluating scripts
-			if page.url == 'about:blank':
-				continue
-
+		async def add_visibility_listener(page_idx: int, page: Page) -> None:
 			try:
 				await page.evaluate(update_tab_focus_script)
 				# self.logger.debug(f'👁️ Added visibility listener to existing tab: {page.url}')
 			except Exception as e:
-				page_idx = self.browser_context.pages.index(page)  # type: ignore
 				self.logger.debug(
 					f'⚠️ Failed to add visibility listener to existing tab, is it crashed or ignoring CDP commands?: [{page_idx}]{page.url}: {type(e).__name__}: {e}'
 				)
 
+		# inject into all tabs concurrently, skip about:blank pages as they can hang when evaluating scripts
+		await asyncio.gather(
+			*(
+				add_visibility_listener(page_idx, page)
+				for page_idx, page in enumerate(self.browser_context.pages)
+				if page.url != 'about:blank'
+			)
+		)
+
 	async def _setup_viewports(self) -> None:
 		"""Resize any existing page viewports to match the configured size, set up storage_state, permissions, geolocation, etc."""
 
@@ -1416,9 +1497,7 @@ class BrowserSession(BaseModel):
 
 		await self.load_storage_state()
 
-		page = None
-
-		for page in self.browser_context.pages:
+		async def setup_existing_page(page: Page) -> None:
 			# apply viewport size settings to any existing pages
 			if viewport:
 				await page.set_viewport_size(viewport)
@@ -1427,7 +1506,11 @@ class BrowserSession(BaseModel):
 			if page.url == 'about:blank':
 				await self._show_dvd_screensaver_loading_animation(page)
 
-		page = page or (await self.browser_context.new_page())
+		# set up all existing pages concurrently instead of one round-trip after another
+		existing_pages = list(self.browser_context.pages)
+		await asyncio.gather(*(setup_existing_page(page) for page in existing_pages))
+
+		page = existing_pages[-1] if existing_pages else (await self.browser_context.new_page())
 
 		if (not viewport) and (self.browser_profile.window_size is not None) and not self.browser_profile.headless:
 			# attempt to resize the actual browser window
@@ -1685,6 +1768,15 @@ class BrowserSession(BaseModel):
 			await page.evaluate(
 				"""
 				try {
+					// Detach the scroll/resize listeners registered for each highlight, otherwise they
+					// (and the array holding their cleanup functions) pile up with every DOM rebuild
+					if (window._highlightCleanupFunctions) {
+						for (const cleanupFn of window._highlightCleanupFunctions) {
+							try { cleanupFn(); } catch (e) {}
+						}
+						window._highlightCleanupFunctions = [];
+					}
+
 					// Remove the highlight container and all its contents
 					const container = document.getElementById('playwright-highlight-container');
 					if (container) {
@@ -1827,16 +1919,18 @@ class BrowserSession(BaseModel):
 	async def get_tabs_info(self) -> list[TabInfo]:
 		"""Get information about all tabs"""
 		assert self.browser_context is not None, 'BrowserContext is not set up'
+		pages = list(self.browser_context.pages)
+		# fetch all titles concurrently so one slow tab doesn't stall the rest
+		titles = await asyncio.gather(*(self._get_page_title(page) for page in pages), return_exceptions=True)
 		tabs_info = []
-		for page_id, page in enumerate(self.browser_context.pages):
-			try:
-				title = await self._get_page_title(page)
-				tab_info = TabInfo(page_id=page_id, url=page.url, title=title)
-			except Exception:
+		for page_id, (page, title) in enumerate(zip(pages, titles)):
+			if isinstance(title, BaseException):
 				# page.title() can hang forever on tabs that are crashed/disappeared/about:blank
 				# we dont want to try automating those tabs because they will hang the whole script
 				self.logger.debug(f'⚠️ Failed to get tab info for tab #{page_id}: {_log_pretty_url(page.url)} (ignoring)')
 				tab_info = TabInfo(page_id=page_id, url='about:blank', title='ignore this tab and do not use it')
+			else:
+				tab_info = TabInfo(page_id=page_id, url=page.url, title=title)
 			tabs_info.append(tab_info)
 
 		return tabs_info
@@ -2139,87 +2233,20 @@ class BrowserSession(BaseModel):
 
 	async def _wait_for_stable_network(self):
 		pending_requests = set()
-		last_activity = asyncio.get_event_loop().time()
+		last_activity = time.monotonic()
+		network_activity = asyncio.Event()  # set whenever a relevant request starts or resolves
 
 		page = await self.get_current_page()
 
-		# Define relevant resource types and content types
-		RELEVANT_RESOURCE_TYPES = {
-			'document',
-			'stylesheet',
-			'image',
-			'font',
-			'script',
-			'iframe',
-		}
-
-		RELEVANT_CONTENT_TYPES = {
-			'text/html',
-			'text/css',
-			'application/javascript',
-			'image/',
-			'font/',
-			'application/json',
-		}
-
-		# Additional patterns to filter out
-		IGNORED_URL_PATTERNS = {
-			# Analytics and tracking
-			'analytics',
-			'tracking',
-			'telemetry',
-			'beacon',
-			'metrics',
-			# Ad-related
-			'doubleclick',
-			'adsystem',
-			'adserver',
-			'advertising',
-			# Social media widgets
-			'facebook.com/plugins',
-			'platform.twitter',
-			'linkedin.com/embed',
-			# Live chat and support
-			'livechat',
-			'zendesk',
-			'intercom',
-			'crisp.chat',
-			'hotjar',
-			# Push notifications
-			'push-notifications',
-			'onesignal',
-			'pushwoosh',
-			# Background sync/heartbeat
-			'heartbeat',
-			'ping',
-			'alive',
-			# WebRTC and streaming
-			'webrtc',
-			'rtmp://',
-			'wss://',
-			# Common CDNs for dynamic content
-			'cloudfront.net',
-			'fastly.net',
-		}
-
 		async def on_request(request):
 			# Filter by resource type
-			if request.resource_type not in RELEVANT_RESOURCE_TYPES:
-				return
-
-			# Filter out streaming, websocket, and other real-time requests
-			if request.resource_type in {
-				'websocket',
-				'media',
-				'eventsource',
-				'manifest',
-				'other',
-			}:
+			# (streaming, websocket, and other real-time request types are never relevant)
+			if request.resource_type not in NETWORK_RELEVANT_RESOURCE_TYPES:
 				return
 
 			# Filter out by URL patterns
 			url = request.url.lower()
-			if any(pattern in url for pattern in IGNORED_URL_PATTERNS):
+			if any(pattern in url for pattern in NETWORK_IGNORED_URL_PATTERNS):
 				return
 
 			# Filter out data URLs and blob URLs
@@ -2228,15 +2255,13 @@ class BrowserSession(BaseModel):
 
 			# Filter out requests with certain headers
 			headers = request.headers
-			if headers.get('purpose') == 'prefetch' or headers.get('sec-fetch-dest') in [
-				'video',
-				'audio',
-			]:
+			if headers.get('purpose') == 'prefetch' or headers.get('sec-fetch-dest') in ('video', 'audio'):
 				return
 
 			nonlocal last_activity
 			pending_requests.add(request)
-			last_activity = asyncio.get_event_loop().time()
+			last_activity = time.monotonic()
+			network_activity.set()
 			# self.logger.debug(f'Request started: {request.url} ({request.resource_type})')
 
 		async def on_response(response):
@@ -2248,24 +2273,12 @@ class BrowserSession(BaseModel):
 			content_type = response.headers.get('content-type', '').lower()
 
 			# Skip if content type indicates streaming or real-time data
-			if any(
-				t in content_type
-				for t in [
-					'streaming',
-					'video',
-					'audio',
-					'webm',
-					'mp4',
-					'event-stream',
-					'websocket',
-					'protobuf',
-				]
-			):
+			if any(t in content_type for t in NETWORK_STREAMING_CONTENT_TYPES):
 				pending_requests.remove(request)
 				return
 
 			# Only process relevant content types
-			if not any(ct in content_type for ct in RELEVANT_CONTENT_TYPES):
+			if not any(ct in content_type for ct in NETWORK_RELEVANT_CONTENT_TYPES):
 				pending_requests.remove(request)
 				return
 
@@ -2277,32 +2290,40 @@ class BrowserSession(BaseModel):
 
 			nonlocal last_activity
 			pending_requests.remove(request)
-			last_activity = asyncio.get_event_loop().time()
+			last_activity = time.monotonic()
+			network_activity.set()
 			# self.logger.debug(f'Request resolved: {request.url} ({content_type})')
 
 		# Attach event listeners
 		page.on('request', on_request)
 		page.on('response', on_response)
 
-		now = asyncio.get_event_loop().time()
+		now = time.monotonic()
 		try:
 			# Wait for idle time
-			start_time = asyncio.get_event_loop().time()
+			start_time = time.monotonic()
+			idle_time = self.browser_profile.wait_for_network_idle_page_load_time
+			deadline = start_time + self.browser_profile.maximum_wait_page_load_time
 			while True:
-				await asyncio.sleep(0.1)
-				now = asyncio.get_event_loop().time()
-				if (
-					len(pending_requests) == 0
-					and (now - last_activity) >= self.browser_profile.wait_for_network_idle_page_load_time
-				):
+				now = time.monotonic()
+				if len(pending_requests) == 0 and (now - last_activity) >= idle_time:
 					break
-				if now - start_time > self.browser_profile.maximum_wait_page_load_time:
+				if now >= deadline:
 					self.logger.debug(
 						f'{self} Network timeout after {self.browser_profile.maximum_wait_page_load_time}s with {len(pending_requests)} '
 						f'pending requests: {[r.url for r in pending_requests]}'
 					)
 					break
 
+				# Sleep until the network goes quiet for long enough or the overall deadline is hit,
+				# waking up early whenever a relevant request starts or resolves
+				wake_at = deadline if pending_requests else min(last_activity + idle_time, deadline)
+				network_activity.clear()
+				try:
+					await asyncio.wait_for(network_activity.wait(), timeout=wake_at - now)
+				except TimeoutError:
+					pass
+
 		finally:
 			# Clean up event listeners
 			page.remove_listener('request', on_request)
@@ -2339,38 +2360,39 @@ class BrowserSession(BaseModel):
 		elapsed = time.time() - start_time
 		remaining = max((timeout_overwrite or self.browser_profile.minimum_wait_page_load_time) - elapsed, 0)
 
-		# just for logging, calculate how much data was downloaded
-		try:
-			bytes_used = await page.evaluate("""
-				() => {
-					let total = 0;
-					for (const entry of performance.getEntriesByType('resource')) {
-						total += entry.transferSize || 0;
-					}
-					for (const nav of performance.getEntriesByType('navigation')) {
-						total += nav.transferSize || 0;
+		# just for logging, calculate how much data was downloaded (skip the extra page.evaluate round-trip if INFO logs are off)
+		if self.logger.isEnabledFor(logging.INFO):
+			try:
+				bytes_used = await page.evaluate("""
+					() => {
+						let total = 0;
+						for (const entry of performance.getEntriesByType('resource')) {
+							total += entry.transferSize || 0;
+						}
+						for (const nav of performance.getEntriesByType('navigation')) {
+							total += nav.transferSize || 0;
+						}
+						return total;
 					}
-					return total;
-				}
-			""")
-		except Exception:
-			bytes_used = None
+				""")
+			except Exception:
+				bytes_used = None
 
-		try:
-			tab_idx = self.tabs.index(page)
-		except ValueError:
-			tab_idx = '??'
+			try:
+				tab_idx = self.tabs.index(page)
+			except ValueError:
+				tab_idx = '??'
 
-		extra_delay = ''
-		if remaining > 0:
-			extra_delay = f', waiting +{remaining:.2f}s for all frames to finish'
+			extra_delay = ''
+			if remaining > 0:
+				extra_delay = f', waiting +{remaining:.2f}s for all frames to finish'
 
-		if bytes_used is not None:
-			self.logger.info(
-				f'➡️ Page navigation [{tab_idx}]{_log_pretty_url(page.url, 40)} used {bytes_used / 1024:.1f} KB in {elapsed:.2f}s{extra_delay}'
-			)
-		else:
-			self.logger.info(f'➡️ Page navigation [{tab_idx}]{_log_pretty_url(page.url, 40)} took {elapsed:.2f}s{extra_delay}')
+			if bytes_used is not None:
+				self.logger.info(
+					f'➡️ Page navigation [{tab_idx}]{_log_pretty_url(page.url, 40)} used {bytes_used / 1024:.1f} KB in {elapsed:.2f}s{extra_delay}'
+				)
+			else:
+				self.logger.info(f'➡️ Page navigation [{tab_idx}]{_log_pretty_url(page.url, 40)} took {elapsed:.2f}s{extra_delay}')
 
 		# Sleep remaining time if needed
 		if remaining > 0:
@@ -2511,15 +2533,15 @@ class BrowserSession(BaseModel):
 	async def get_page_structure(self) -> str:
 		"""Get a debug view of the page structure including iframes"""
 		debug_script = """(() => {
+			// Skip certain elements that clutter the output (built once, not per visited element)
+			const skipTags = new Set(['script', 'style', 'link', 'meta', 'noscript']);
+
 			function getPageStructure(element = document, depth = 0, maxDepth = 10) {
 				if (depth >= maxDepth) return '';
 
 				const indent = '  '.repeat(depth);
 				let structure = '';
 
-				// Skip certain elements that clutter the output
-				const skipTags = new Set(['script', 'style', 'link', 'meta', 'noscript']);
-
 				// Add current element info if it's not the document
 				if (element !== document) {
 					const tagName = element.tagName.toLowerCase();
@@ -2533,12 +2555,12 @@ class BrowserSession(BaseModel):
 
 					// Get additional useful attributes
 					const attrs = [];
-					if (element.getAttribute('role')) attrs.push(`role="${element.getAttribute('role')}"`);
-					if (element.getAttribute('aria-label')) attrs.push(`aria-label="${element.getAttribute('aria-label')}"`);
-					if (element.getAttribute('type')) attrs.push(`type="${element.getAttribute('type')}"`);
-					if (element.getAttribute('name')) attrs.push(`name="${element.getAttribute('name')}"`);
-					if (element.getAttribute('src')) {
-						const src = element.getAttribute('src');
+					for (const attrName of ['role', 'aria-label', 'type', 'name']) {
+						const value = element.getAttribute(attrName);
+						if (value) attrs.push(`${attrName}="${value}"`);
+					}
+					const src = element.getAttribute('src');
+					if (src) {
 						attrs.push(`src="${src.substring(0, 50)}${src.length > 50 ? '...' : ''}"`);
 					}
 
@@ -2600,20 +2622,25 @@ class BrowserSession(BaseModel):
 		# Find out which elements are new
 		# Do this only if url has not changed
 		if cache_clickable_elements_hashes:
+			# walk the tree and hash each clickable element only once, the hashes are used both
+			# to mark the new elements and as the cache for the next state
+			# Pointers, feel free to edit in place
+			updated_state_clickable_elements = ClickableElementProcessor.get_clickable_elements(updated_state.element_tree)
+			updated_state_hashes = [
+				ClickableElementProcessor.hash_dom_element(dom_element) for dom_element in updated_state_clickable_elements
+			]
+
 			# if we are on the same url as the last state, we can use the cached hashes
 			if self._cached_clickable_element_hashes and self._cached_clickable_element_hashes.url == updated_state.url:
-				# Pointers, feel free to edit in place
-				updated_state_clickable_elements = ClickableElementProcessor.get_clickable_elements(updated_state.element_tree)
-
-				for dom_element in updated_state_clickable_elements:
+				for dom_element, element_hash in zip(updated_state_clickable_elements, updated_state_hashes):
 					dom_element.is_new = (
-						ClickableElementProcessor.hash_dom_element(dom_element)
+						element_hash
 						not in self._cached_clickable_element_hashes.hashes  # see which elements are new from the last state where we cached the hashes
 					)
 			# in any case, we need to cache the new hashes
 			self._cached_clickable_element_hashes = CachedClickableElementHashes(
 				url=updated_state.url,
-				hashes=ClickableElementProcessor.get_clickable_elements_hashes(updated_state.element_tree),
+				hashes=set(updated_state_hashes),
 			)
 
 		assert updated_state
@@ -2672,13 +2699,14 @@ class BrowserSession(BaseModel):
 				self.logger.warning(f'Failed to capture screenshot: {type(e).__name__}: {e}')
 				screenshot_b64 = None
 
-			pixels_above, pixels_below = await self.get_scroll_info(page)
+			# independent round-trips to the page, send them together instead of one after another
+			(pixels_above, pixels_below), title = await asyncio.gather(self.get_scroll_info(page), page.title())
 
 			self.browser_state_summary = BrowserStateSummary(
 				element_tree=content.element_tree,
 				selector_map=content.selector_map,
 				url=page.url,
-				title=await page.title(),
+				title=title,
 				tabs=tabs_info,
 				screenshot=screenshot_b64,
 				pixels_above=pixels_above,
@@ -2841,9 +2869,6 @@ class BrowserSession(BaseModel):
 
 			# Handle class attributes
 			if 'class' in element.attributes and element.attributes['class'] and include_dynamic_attributes:
-				# Define a regex pattern for valid class names in CSS
-				valid_class_name_pattern = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_-]*$')
-
 				# Iterate through the class attribute values
 				classes = element.attributes['class'].split()
 				for class_name in classes:
@@ -2852,48 +2877,16 @@ class BrowserSession(BaseModel):
 						continue
 
 					# Check if the class name is valid
-					if valid_class_name_pattern.match(class_name):
+					if CSS_VALID_CLASS_NAME_RE.match(class_name):
 						# Append the valid class name to the CSS selector
 						css_selector += f'.{class_name}'
 					else:
 						# Skip invalid class names
 						continue
 
-			# Expanded set of safe attributes that are stable and useful for selection
-			SAFE_ATTRIBUTES = {
-				# Data attributes (if they're stable in your application)
-				'id',
-				# Standard HTML attributes
-				'name',
-				'type',
-				'placeholder',
-				# Accessibility attributes
-				'aria-label',
-				'aria-labelledby',
-				'aria-describedby',
-				'role',
-				# Common form attributes
-				'for',
-				'autocomplete',
-				'required',
-				'readonly',
-				# Media attributes
-				'alt',
-				'title',
-				'src',
-				# Custom stable attributes (add any application-specific ones)
-				'href',
-				'target',
-			}
-
-			if include_dynamic_attributes:
-				dynamic_attributes = {
-					'data-id',
-					'data-qa',
-					'data-cy',
-					'data-testid',
-				}
-				SAFE_ATTRIBUTES.update(dynamic_attributes)
+			safe_attributes = (
+				CSS_SELECTOR_SAFE_AND_DYNAMIC_ATTRIBUTES if include_dynamic_attributes else CSS_SELECTOR_SAFE_ATTRIBUTES
+			)
 
 			# Handle other attributes
 			for attribute, value in element.attributes.items():
@@ -2904,7 +2897,7 @@ class BrowserSession(BaseModel):
 				if not attribute.strip():
 					continue
 
-				if attribute not in SAFE_ATTRIBUTES:
+				if attribute not in safe_attributes:
 					continue
 
 				# Escape special characters in attribute names
@@ -2919,7 +2912,7 @@ class BrowserSession(BaseModel):
 					if '\n' in value:
 						value = value.split('\n')[0]
 					# Regex-substitute *any* whitespace with a single space, then strip.
-					collapsed_value = re.sub(r'\s+', ' ', value).strip()
+					collapsed_value = CSS_WHITESPACE_RE.sub(' ', value).strip()
 					# Escape embedded double-quotes.
 					safe_value = collapsed_value.replace('"', '\\"')
 					css_selector += f'[{safe_attribute}*="{safe_value}"]'
@@ -2944,8 +2937,7 @@ class BrowserSession(BaseModel):
 		to incorrectly consider hidden elements as visible. By additionally checking the bounding box
 		dimensions, we catch elements that have zero width/height regardless of how they were hidden.
 		"""
-		is_hidden = await element.is_hidden()
-		bbox = await element.bounding_box()
+		is_hidden, bbox = await asyncio.gather(element.is_hidden(), element.bounding_box())
 
 		return not is_hidden and bbox is not None and bbox['width'] > 0 and bbox['height'] > 0
 
@@ -3303,8 +3295,10 @@ class BrowserSession(BaseModel):
 			f'Starting agent {str(self.id)[-4:]}...'  # set up by self._show_dvd_screensaver_loading_animation()
 		)
 		for page in self.browser_context.pages:
-			page_title = await page.title()
-			if page.url == 'about:blank' and page != self.agent_current_page and page_title == title_of_our_setup_tab:
+			# check the cheap local conditions first, only ask the browser for the title of candidate tabs
+			if page.url != 'about:blank' or page == self.agent_current_page:
+				continue
+			if await page.title() == title_of_our_setup_tab:
 				await page.close()
 				self.human_current_page = (  # in case we just closed the human's tab, fix the refs
 					self.human_current_page if not self.human_current_page.is_closed() else self.agent_current_page
@@ -3343,7 +3337,7 @@ class BrowserSession(BaseModel):
 	def is_file_input(node: DOMElementNode) -> bool:
 		return (
 			isinstance(node, DOMElementNode)
-			and getattr(node, 'tag_name', '').lower() == 'input'
+			and node.tag_name.lower() == 'input'
 			and node.attributes.get('type', '').lower() == 'file'
 		)
 
@@ -3367,14 +3361,15 @@ class BrowserSession(BaseModel):
 			candidate_element = selector_map[index]
 
 			def find_file_input_in_descendants(node: DOMElementNode, depth: int) -> DOMElementNode | None:
-				if depth < 0 or not isinstance(node, DOMElementNode):
-					return None
-				if self.is_file_input(node):
-					return node
-				for child in getattr(node, 'children', []):
-					result = find_file_input_in_descendants(child, depth - 1)
-					if result:
-						return result
+				# depth-first in document order, with an explicit stack instead of recursion
+				stack: list[tuple[DOMBaseNode, int]] = [(node, depth)]
+				while stack:
+					current_node, current_depth = stack.pop()
+					if current_depth < 0 or not isinstance(current_node, DOMElementNode):
+						continue
+					if self.is_file_input(current_node):
+						return current_node
+					stack.extend((child, current_depth - 1) for child in reversed(current_node.children))
 				return None
 
 			current = candidate_element
@@ -3387,9 +3382,9 @@ class BrowserSession(BaseModel):
 				if result:
 					return result
 				# 3. Check all siblings and their descendants
-				parent = getattr(current, 'parent', None)
+				parent = current.parent
 				if parent:
-					for sibling in getattr(parent, 'children', []):
+					for sibling in parent.children:
 						if sibling is current:
 							continue
 						if self.is_file_input(sibling):
@@ -3411,9 +3406,9 @@ class BrowserSession(BaseModel):
 	@require_initialization
 	async def get_scroll_info(self, page: Page) -> tuple[int, int]:
 		"""Get scroll position information for the current page."""
-		scroll_y = await page.evaluate('window.scrollY')
-		viewport_height = await page.evaluate('window.innerHeight')
-		total_height = await page.evaluate('document.documentElement.scrollHeight')
+		scroll_y, viewport_height, total_height = await page.evaluate(
+			'() => [window.scrollY, window.innerHeight, document.documentElement.scrollHeight]'
+		)
 		pixels_above = scroll_y
 		pixels_below = total_height - (scroll_y + viewport_height)
 		return pixels_above, pixels_below
@@ -368,14 +368,20 @@ Only use this for extracting info from a single product/article page, not for en
 			content = await loop.run_in_executor(None, markdownify_func, page_html)
 
 			# manually append iframe text into the content so it's readable by the LLM (includes cross-origin iframes)
-			for iframe in page.frames:
-				try:
-					await iframe.wait_for_load_state(timeout=5000)  # extra on top of already loaded page
-				except Exception as e:
-					pass
-
-				if iframe.url != page.url and not iframe.url.startswith('data:'):
-					content += f'\n\nIFRAME {iframe.url}:\n'
+			# frames are fetched concurrently (capped so pages full of ad iframes don't flood the connection)
+			# instead of paying one round-trip after another, gather() keeps the results in page.frames order
+			iframe_semaphore = asyncio.Semaphore(8)
+
+			async def get_iframe_markdown(iframe) -> str:
+				async with iframe_semaphore:
+					try:
+						await iframe.wait_for_load_state(timeout=5000)  # extra on top of already loaded page
+					except Exception as e:
+						pass
+
+					if iframe.url == page.url or iframe.url.startswith('data:'):
+						return ''
+
 					# Run markdownify in a thread pool for iframe content as well
 					try:
 						iframe_html = await iframe.content()
@@ -383,7 +389,11 @@ Only use this for extracting info from a single product/article page, not for en
 					except Exception as e:
 						logger.debug(f'Error extracting iframe content from within page {page.url}: {type(e).__name__}: {e}')
 						iframe_markdown = ''
-					content += iframe_markdown
+					return f'\n\nIFRAME {iframe.url}:\n' + iframe_markdown
+
+			iframe_markdowns = await asyncio.gather(*(get_iframe_markdown(iframe) for iframe in page.frames))
+			# join once instead of re-copying the (potentially huge) page markdown for every iframe
+			content = ''.join([content, *iframe_markdowns])
 
 			# limit to 40000 characters - remove text in the middle this is approx 20000 tokens
 			max_chars = 40000
@@ -626,48 +636,53 @@ Explain the content of the page and that the requested information is not availa
 
 			try:
 				# Frame-aware approach since we know it works
-				all_options = []
-				frame_index = 0
+				# query all frames concurrently (capped), gather() keeps the results in page.frames order
+				frame_semaphore = asyncio.Semaphore(8)
 
-				for frame in page.frames:
-					try:
-						options = await frame.evaluate(
-							"""
-							(xpath) => {
-								const select = document.evaluate(xpath, document, null,
-									XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
-								if (!select) return null;
-
-								return {
-									options: Array.from(select.options).map(opt => ({
-										text: opt.text, //do not trim, because we are doing exact match in select_dropdown_option
-										value: opt.value,
-										index: opt.index
-									})),
-									id: select.id,
-									name: select.name
-								};
-							}
-						""",
-							dom_element.xpath,
-						)
+				async def get_frame_options(frame_index: int, frame) -> list[str]:
+					async with frame_semaphore:
+						try:
+							options = await frame.evaluate(
+								"""
+								(xpath) => {
+									const select = document.evaluate(xpath, document, null,
+										XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+									if (!select) return null;
+
+									return {
+										options: Array.from(select.options).map(opt => ({
+											text: opt.text, //do not trim, because we are doing exact match in select_dropdown_option
+											value: opt.value,
+											index: opt.index
+										})),
+										id: select.id,
+										name: select.name
+									};
+								}
+							""",
+								dom_element.xpath,
+							)
 
-						if options:
-							logger.debug(f'Found dropdown in frame {frame_index}')
-							logger.debug(f'Dropdown ID: {options["id"]}, Name: {options["name"]}')
+							if options:
+								logger.debug(f'Found dropdown in frame {frame_index}')
+								logger.debug(f'Dropdown ID: {options["id"]}, Name: {options["name"]}')
 
-							formatted_options = []
-							for opt in options['options']:
-								# encoding ensures AI uses the exact string in select_dropdown_option
-								encoded_text = json.dumps(opt['text'])
-								formatted_options.append(f'{opt["index"]}: text={encoded_text}')
+								formatted_options = []
+								for opt in options['options']:
+									# encoding ensures AI uses the exact string in select_dropdown_option
+									encoded_text = json.dumps(opt['text'])
+									formatted_options.append(f'{opt["index"]}: text={encoded_text}')
 
-							all_options.extend(formatted_options)
+								return formatted_options
+						except Exception as frame_e:
+							logger.debug(f'Frame {frame_index} evaluation failed: {str(frame_e)}')
 
-					except Exception as frame_e:
-						logger.debug(f'Frame {frame_index} evaluation failed: {str(frame_e)}')
+					return []
 
-					frame_index += 1
+				frame_options = await asyncio.gather(
+					*(get_frame_options(frame_index, frame) for frame_index, frame in enumerate(page.frames))
+				)
+				all_options = [option for options in frame_options for option in options]
 
 				if all_options:
 					msg = '\n'.join(all_options)
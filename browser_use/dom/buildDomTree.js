@@ -217,6 +217,9 @@
   // Add a WeakMap cache for XPath strings
   const xpathCache = new WeakMap();
 
+  // Per-parent cache of child xpath positions (parent element -> Map(child -> position))
+  const elementPositionCache = new WeakMap();
+
   // Initialize once and reuse
   const viewportObserver = new IntersectionObserver(
     (entries) => {
@@ -469,21 +472,40 @@
   }
 
   function getElementPosition(currentElement) {
-    if (!currentElement.parentElement) {
+    const parent = currentElement.parentElement;
+    if (!parent) {
       return 0; // No parent means no siblings
     }
-  
-    const tagName = currentElement.nodeName.toLowerCase();
-  
-    const siblings = Array.from(currentElement.parentElement.children)
-      .filter((sib) => sib.nodeName.toLowerCase() === tagName);
-  
-    if (siblings.length === 1) {
-      return 0; // Only element of its type
+
+    // Compute the positions of all of the parent's children in one pass and cache them,
+    // instead of re-filtering every sibling for each child (quadratic on long lists/tables)
+    let positions = elementPositionCache.get(parent);
+    if (!positions) {
+      positions = new Map();
+      const children = parent.children;
+      const tagNames = new Array(children.length);
+      const countByTag = new Map();
+      for (let i = 0; i < children.length; i++) {
+        const tagName = children[i].nodeName.toLowerCase();
+        tagNames[i] = tagName;
+        countByTag.set(tagName, (countByTag.get(tagName) || 0) + 1);
+      }
+
+      const seenByTag = new Map();
+      for (let i = 0; i < children.length; i++) {
+        const tagName = tagNames[i];
+        if (countByTag.get(tagName) === 1) {
+          positions.set(children[i], 0); // Only element of its type
+        } else {
+          const index = (seenByTag.get(tagName) || 0) + 1; // 1-based index
+          seenByTag.set(tagName, index);
+          positions.set(children[i], index);
+        }
+      }
+      elementPositionCache.set(parent, positions);
     }
-  
-    const index = siblings.indexOf(currentElement) + 1; // 1-based index
-    return index;
+
+    return positions.get(currentElement) ?? 0;
   }
 
   /**
@@ -494,6 +516,7 @@
     
     const segments = [];
     let currentElement = element;
+    let ancestorXPath = "";
 
     while (currentElement && currentElement.nodeType === Node.ELEMENT_NODE) {
       // Stop if we hit a shadow root or iframe
@@ -505,15 +528,23 @@
         break;
       }
 
+      // The tree is walked top-down, so the parent's xpath is almost always cached already:
+      // reuse it instead of re-walking every ancestor up to the root for each element
+      if (currentElement !== element && xpathCache.has(currentElement)) {
+        ancestorXPath = xpathCache.get(currentElement);
+        break;
+      }
+
       const position = getElementPosition(currentElement);
       const tagName = currentElement.nodeName.toLowerCase();
       const xpathIndex = position > 0 ? `[${position}]` : "";
-      segments.unshift(`${tagName}${xpathIndex}`);
+      segments.push(`${tagName}${xpathIndex}`);
 
       currentElement = currentElement.parentNode;
     }
 
-    const result = segments.join("/");
+    const ownXPath = segments.reverse().join("/");
+    const result = ancestorXPath ? `${ancestorXPath}/${ownXPath}` : ownXPath;
     xpathCache.set(element, result);
     return result;
   }
@@ -598,29 +629,31 @@
     }
   }
 
+  // Tag sets for isElementAccepted, built once instead of on every call
+  // Always accept body and common container elements
+  const ALWAYS_ACCEPTED_TAGS = new Set([
+    "body", "div", "main", "article", "section", "nav", "header", "footer"
+  ]);
+
+  const LEAF_ELEMENT_DENY_LIST = new Set([
+    "svg",
+    "script",
+    "style",
+    "link",
+    "meta",
+    "noscript",
+    "template",
+  ]);
+
   // Helper function to check if element is accepted
   function isElementAccepted(element) {
     if (!element || !element.tagName) return false;
 
-    // Always accept body and common container elements
-    const alwaysAccept = new Set([
-      "body", "div", "main", "article", "section", "nav", "header", "footer"
-    ]);
     const tagName = element.tagName.toLowerCase();
 
-    if (alwaysAccept.has(tagName)) return true;
-
-    const leafElementDenyList = new Set([
-      "svg",
-      "script",
-      "style",
-      "link",
-      "meta",
-      "noscript",
-      "template",
-    ]);
+    if (ALWAYS_ACCEPTED_TAGS.has(tagName)) return true;
 
-    return !leafElementDenyList.has(tagName);
+    return !LEAF_ELEMENT_DENY_LIST.has(tagName);
   }
 
   /**
@@ -636,6 +669,104 @@
     );
   }
 
+  // Lookup sets for isInteractiveElement, built once instead of on every call
+
+  // Define interactive cursors
+  const INTERACTIVE_CURSORS = new Set([
+    'pointer',    // Link/clickable elements
+    'move',       // Movable elements
+    'text',       // Text selection
+    'grab',       // Grabbable elements
+    'grabbing',   // Currently grabbing
+    'cell',       // Table cell selection
+    'copy',       // Copy operation
+    'alias',      // Alias creation
+    'all-scroll', // Scrollable content
+    'col-resize', // Column resize
+    'context-menu', // Context menu available
+    'crosshair',  // Precise selection
+    'e-resize',   // East resize
+    'ew-resize',  // East-west resize
+    'help',       // Help available
+    'n-resize',   // North resize
+    'ne-resize',  // Northeast resize
+    'nesw-resize', // Northeast-southwest resize
+    'ns-resize',  // North-south resize
+    'nw-resize',  // Northwest resize
+    'nwse-resize', // Northwest-southeast resize
+    'row-resize', // Row resize
+    's-resize',   // South resize
+    'se-resize',  // Southeast resize
+    'sw-resize',  // Southwest resize
+    'vertical-text', // Vertical text selection
+    'w-resize',   // West resize
+    'zoom-in',    // Zoom in
+    'zoom-out'    // Zoom out
+  ]);
+
+  // Define non-interactive cursors
+  const NON_INTERACTIVE_CURSORS = new Set([
+    'not-allowed', // Action not allowed
+    'no-drop',     // Drop not allowed
+    'wait',        // Processing
+    'progress',    // In progress
+    'initial',     // Initial value
+    'inherit'      // Inherited value
+    //? Let's just include all potentially clickable elements that are not specifically blocked
+    // 'none',        // No cursor
+    // 'default',     // Default cursor 
+    // 'auto',        // Browser default
+  ]);
+
+  const INTERACTIVE_ELEMENTS = new Set([
+    "a",          // Links
+    "button",     // Buttons
+    "input",      // All input types (text, checkbox, radio, etc.)
+    "select",     // Dropdown menus
+    "textarea",   // Text areas
+    "details",    // Expandable details
+    "summary",    // Summary element (clickable part of details)
+    "label",      // Form labels (often clickable)
+    "option",     // Select options
+    "optgroup",   // Option groups
+    "fieldset",   // Form fieldsets (can be interactive with legend)
+    "legend",     // Fieldset legends
+  ]);
+
+  // Define explicit disable attributes and properties
+  const EXPLICIT_DISABLE_TAGS = new Set([
+    'disabled',           // Standard disabled attribute
+    // 'aria-disabled',      // ARIA disabled state
+    'readonly',          // Read-only state
+    // 'aria-readonly',     // ARIA read-only state
+    // 'aria-hidden',       // Hidden from accessibility
+    // 'hidden',            // Hidden attribute
+    // 'inert',             // Inert attribute
+    // 'aria-inert',        // ARIA inert state
+    // 'tabindex="-1"',     // Removed from tab order
+    // 'aria-hidden="true"' // Hidden from screen readers
+  ]);
+
+  const INTERACTIVE_ELEMENT_ROLES = new Set([
+    'button',           // Directly clickable element
+    // 'link',            // Clickable link
+    // 'menuitem',        // Clickable menu item
+    'menuitemradio',   // Radio-style menu item (selectable)
+    'menuitemcheckbox', // Checkbox-style menu item (toggleable)
+    'radio',           // Radio button (selectable)
+    'checkbox',        // Checkbox (toggleable)
+    'tab',             // Tab (clickable to switch content)
+    'switch',          // Toggle switch (clickable to change state)
+    'slider',          // Slider control (draggable)
+    'spinbutton',      // Number input with up/down controls
+    'combobox',        // Dropdown with text input
+    'searchbox',       // Search input field
+    'textbox',         // Text input field
+    // 'listbox',         // Selectable list
+    'option',          // Selectable option in a list
+    'scrollbar'        // Scrollable control
+  ]);
+
   /**
    * Checks if an element is interactive.
    * 
@@ -652,57 +783,10 @@
     const tagName = element.tagName.toLowerCase();
     const style = getCachedComputedStyle(element);
 
-    // Define interactive cursors
-    const interactiveCursors = new Set([
-      'pointer',    // Link/clickable elements
-      'move',       // Movable elements
-      'text',       // Text selection
-      'grab',       // Grabbable elements
-      'grabbing',   // Currently grabbing
-      'cell',       // Table cell selection
-      'copy',       // Copy operation
-      'alias',      // Alias creation
-      'all-scroll', // Scrollable content
-      'col-resize', // Column resize
-      'context-menu', // Context menu available
-      'crosshair',  // Precise selection
-      'e-resize',   // East resize
-      'ew-resize',  // East-west resize
-      'help',       // Help available
-      'n-resize',   // North resize
-      'ne-resize',  // Northeast resize
-      'nesw-resize', // Northeast-southwest resize
-      'ns-resize',  // North-south resize
-      'nw-resize',  // Northwest resize
-      'nwse-resize', // Northwest-southeast resize
-      'row-resize', // Row resize
-      's-resize',   // South resize
-      'se-resize',  // Southeast resize
-      'sw-resize',  // Southwest resize
-      'vertical-text', // Vertical text selection
-      'w-resize',   // West resize
-      'zoom-in',    // Zoom in
-      'zoom-out'    // Zoom out
-    ]);
-
-    // Define non-interactive cursors
-    const nonInteractiveCursors = new Set([
-      'not-allowed', // Action not allowed
-      'no-drop',     // Drop not allowed
-      'wait',        // Processing
-      'progress',    // In progress
-      'initial',     // Initial value
-      'inherit'      // Inherited value
-      //? Let's just include all potentially clickable elements that are not specifically blocked
-      // 'none',        // No cursor
-      // 'default',     // Default cursor 
-      // 'auto',        // Browser default
-    ]);
-
     function doesElementHaveInteractivePointer(element) {
       if (element.tagName.toLowerCase() === "html") return false;
 
-      if (interactiveCursors.has(style.cursor)) return true;
+      if (INTERACTIVE_CURSORS.has(style.cursor)) return true;
 
       return false;
     }
@@ -714,44 +798,15 @@
       return true;
     }
 
-    const interactiveElements = new Set([
-      "a",          // Links
-      "button",     // Buttons
-      "input",      // All input types (text, checkbox, radio, etc.)
-      "select",     // Dropdown menus
-      "textarea",   // Text areas
-      "details",    // Expandable details
-      "summary",    // Summary element (clickable part of details)
-      "label",      // Form labels (often clickable)
-      "option",     // Select options
-      "optgroup",   // Option groups
-      "fieldset",   // Form fieldsets (can be interactive with legend)
-      "legend",     // Fieldset legends
-    ]);
-
-    // Define explicit disable attributes and properties
-    const explicitDisableTags = new Set([
-      'disabled',           // Standard disabled attribute
-      // 'aria-disabled',      // ARIA disabled state
-      'readonly',          // Read-only state
-      // 'aria-readonly',     // ARIA read-only state
-      // 'aria-hidden',       // Hidden from accessibility
-      // 'hidden',            // Hidden attribute
-      // 'inert',             // Inert attribute
-      // 'aria-inert',        // ARIA inert state
-      // 'tabindex="-1"',     // Removed from tab order
-      // 'aria-hidden="true"' // Hidden from screen readers
-    ]);
-
     // handle inputs, select, checkbox, radio, textarea, button and make sure they are not cursor style disabled/not-allowed
-    if (interactiveElements.has(tagName)) {
+    if (INTERACTIVE_ELEMENTS.has(tagName)) {
       // Check for non-interactive cursor
-      if (nonInteractiveCursors.has(style.cursor)) {
+      if (NON_INTERACTIVE_CURSORS.has(style.cursor)) {
         return false;
       }
 
       // Check for explicit disable attributes
-      for (const disableTag of explicitDisableTags) {
+      for (const disableTag of EXPLICIT_DISABLE_TAGS) {
         if (element.hasAttribute(disableTag) ||
           element.getAttribute(disableTag) === 'true' ||
           element.getAttribute(disableTag) === '') {
@@ -796,31 +851,11 @@
       return true;
     }
 
-    const interactiveRoles = new Set([
-      'button',           // Directly clickable element
-      // 'link',            // Clickable link
-      // 'menuitem',        // Clickable menu item
-      'menuitemradio',   // Radio-style menu item (selectable)
-      'menuitemcheckbox', // Checkbox-style menu item (toggleable)
-      'radio',           // Radio button (selectable)
-      'checkbox',        // Checkbox (toggleable)
-      'tab',             // Tab (clickable to switch content)
-      'switch',          // Toggle switch (clickable to change state)
-      'slider',          // Slider control (draggable)
-      'spinbutton',      // Number input with up/down controls
-      'combobox',        // Dropdown with text input
-      'searchbox',       // Search input field
-      'textbox',         // Text input field
-      // 'listbox',         // Selectable list
-      'option',          // Selectable option in a list
-      'scrollbar'        // Scrollable control
-    ]);
-
     // Basic role/attribute checks
     const hasInteractiveRole =
-      interactiveElements.has(tagName) ||
-      interactiveRoles.has(role) ||
-      interactiveRoles.has(ariaRole);
+      INTERACTIVE_ELEMENTS.has(tagName) ||
+      INTERACTIVE_ELEMENT_ROLES.has(role) ||
+      INTERACTIVE_ELEMENT_ROLES.has(ariaRole);
 
     if (hasInteractiveRole) return true;
 
@@ -1013,18 +1048,18 @@
     }, 'scrollOperations');
   }
 
+  // Fast-path for common interactive elements in isInteractiveCandidate (built once instead of on every call)
+  const INTERACTIVE_CANDIDATE_TAGS = new Set([
+    "a", "button", "input", "select", "textarea", "details", "summary", "label"
+  ]);
+
   // Add these helper functions at the top level
   function isInteractiveCandidate(element) {
     if (!element || element.nodeType !== Node.ELEMENT_NODE) return false;
 
     const tagName = element.tagName.toLowerCase();
 
-    // Fast-path for common interactive elements
-    const interactiveElements = new Set([
-      "a", "button", "input", "select", "textarea", "details", "summary", "label"
-    ]);
-
-    if (interactiveElements.has(tagName)) return true;
+    if (INTERACTIVE_CANDIDATE_TAGS.has(tagName)) return true;
 
     // Quick attribute checks without getting full lists
     const hasQuickInteractiveAttr = element.hasAttribute("onclick") ||
@@ -1222,11 +1257,6 @@
 
     if (debugMode) PERF_METRICS.nodeMetrics.totalNodes++;
 
-    if (!node || node.id === HIGHLIGHT_CONTAINER_ID) {
-      if (debugMode) PERF_METRICS.nodeMetrics.skippedNodes++;
-      return null;
-    }
-
     // Special handling for root node (body)
     if (node === document.body) {
       const nodeData = {
@@ -1248,12 +1278,6 @@
       return id;
     }
 
-    // Early bailout for non-element nodes except text
-    if (node.nodeType !== Node.ELEMENT_NODE && node.nodeType !== Node.TEXT_NODE) {
-      if (debugMode) PERF_METRICS.nodeMetrics.skippedNodes++;
-      return null;
-    }
-
     // Process text nodes
     if (node.nodeType === Node.TEXT_NODE) {
       const textContent = node.textContent.trim();
@@ -1310,19 +1334,25 @@
       }
     }
 
-    // Process element node
+    // Process element node (lowercase the tag name once, it's checked several times below)
+    const tagName = node.tagName.toLowerCase();
     const nodeData = {
-      tagName: node.tagName.toLowerCase(),
+      tagName,
       attributes: {},
       xpath: getXPathTree(node, true),
       children: [],
     };
 
     // Get attributes for interactive elements or potential text containers
-    if (isInteractiveCandidate(node) || node.tagName.toLowerCase() === 'iframe' || node.tagName.toLowerCase() === 'body') {
-      const attributeNames = node.getAttributeNames?.() || [];
-      for (const name of attributeNames) {
-        nodeData.attributes[name] = node.getAttribute(name);
+    if (tagName === 'iframe' || tagName === 'body' || isInteractiveCandidate(node)) {
+      // Read name/value pairs straight off the NamedNodeMap in one pass instead of
+      // getAttributeNames() followed by a getAttribute() lookup per name
+      const attributes = node.attributes;
+      if (attributes) {
+        for (let i = 0; i < attributes.length; i++) {
+          const attr = attributes[i];
+          nodeData.attributes[attr.name] = attr.value;
+        }
       }
     }
 
@@ -1340,22 +1370,30 @@
       }
     }
 
-    // Process children, with special handling for iframes and rich text editors
-    if (node.tagName) {
-      const tagName = node.tagName.toLowerCase();
+    // Nothing inside a display:none element gets rendered, so its subtree can't hold visible text or
+    // interactive elements: skip walking it (collapsed menus, closed modals etc. can be huge).
+    // Hidden file inputs are the exception, see below.
+    // The computed style is already cached from isElementVisible above.
+    const isDisplayNone = !nodeData.isVisible && getCachedComputedStyle(node)?.display === "none";
 
+    // Process children, with special handling for iframes and rich text editors
+    if (!isDisplayNone) {
       // Handle iframes
       if (tagName === "iframe") {
-        try {
-          const iframeDoc = node.contentDocument || node.contentWindow?.document;
-          if (iframeDoc) {
-            for (const child of iframeDoc.childNodes) {
-              const domElement = buildDomTree(child, node, false);
-              if (domElement) nodeData.children.push(domElement);
+        // A zero-size or visibility:hidden iframe (tracking pixels, ad/analytics frames) can't render
+        // anything the agent could see or click, so don't walk its whole document
+        if (nodeData.isVisible) {
+          try {
+            const iframeDoc = node.contentDocument || node.contentWindow?.document;
+            if (iframeDoc) {
+              for (const child of iframeDoc.childNodes) {
+                const domElement = buildDomTree(child, node, false);
+                if (domElement) nodeData.children.push(domElement);
+              }
             }
+          } catch (e) {
+            console.warn("Unable to access iframe:", e);
           }
-        } catch (e) {
-          console.warn("Unable to access iframe:", e);
         }
       }
       // Handle rich text editors and contenteditable elements
@@ -1389,6 +1427,13 @@
           if (domElement) nodeData.children.push(domElement);
         }
       }
+    } else {
+      // Custom upload buttons usually trigger an <input type=file> tucked away in a display:none wrapper,
+      // keep those inputs so find_file_upload_element_by_index() can still resolve them from the button
+      for (const fileInput of node.querySelectorAll('input[type="file" i]')) {
+        const domElement = buildDomTree(fileInput, parentIframe, false);
+        if (domElement) nodeData.children.push(domElement);
+      }
     }
 
     // Skip empty anchor tags only if they have no dimensions and no children
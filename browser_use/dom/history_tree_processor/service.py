@@ -34,26 +34,21 @@ class HistoryTreeProcessor:
 	def find_history_element_in_tree(dom_history_element: DOMHistoryElement, tree: DOMElementNode) -> DOMElementNode | None:
 		hashed_dom_history_element = HistoryTreeProcessor._hash_dom_history_element(dom_history_element)
 
-		def process_node(node: DOMElementNode):
+		# Explicit stack instead of recursion (pre-order, children pushed in reverse so the first match in document order wins)
+		stack: list[DOMElementNode] = [tree]
+		while stack:
+			node = stack.pop()
 			if node.highlight_index is not None:
-				hashed_node = HistoryTreeProcessor._hash_dom_element(node)
-				if hashed_node == hashed_dom_history_element:
+				# node.hash is cached on the element, so repeated lookups against the same tree don't rehash it
+				if node.hash == hashed_dom_history_element:
 					return node
-			for child in node.children:
-				if isinstance(child, DOMElementNode):
-					result = process_node(child)
-					if result is not None:
-						return result
-			return None
-
-		return process_node(tree)
+			stack.extend(child for child in reversed(node.children) if isinstance(child, DOMElementNode))
+		return None
 
 	@staticmethod
 	def compare_history_element_and_dom_element(dom_history_element: DOMHistoryElement, dom_element: DOMElementNode) -> bool:
 		hashed_dom_history_element = HistoryTreeProcessor._hash_dom_history_element(dom_history_element)
-		hashed_dom_element = HistoryTreeProcessor._hash_dom_element(dom_element)
-
-		return hashed_dom_history_element == hashed_dom_element
+		return hashed_dom_history_element == dom_element.hash
 
 	@staticmethod
 	def _hash_dom_history_element(dom_history_element: DOMHistoryElement) -> HashedDomElement:
@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import sys
+from functools import cache
 from importlib import resources
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
@@ -17,6 +20,15 @@ from browser_use.dom.views import (
 )
 from browser_use.utils import time_execution_async
 
+
+@cache
+def _load_build_dom_tree_js() -> str:
+	# a new DomService is created for every browser state update, only read the script from disk once per process
+	return resources.files('browser_use.dom').joinpath('buildDomTree.js').read_text()
+
+
+AD_TRACKER_DOMAINS = ('doubleclick.net', 'adroll.com', 'googletagmanager.com')
+
 # @dataclass
 # class ViewportInfo:
 # 	width: int
@@ -31,7 +43,7 @@ class DomService:
 		self.xpath_cache = {}
 		self.logger = logger or logging.getLogger(__name__)
 
-		self.js_code = resources.files('browser_use.dom').joinpath('buildDomTree.js').read_text()
+		self.js_code = _load_build_dom_tree_js()
 
 	# region - Clickable elements
 	@time_execution_async('--get_clickable_elements')
@@ -47,20 +59,22 @@ class DomService:
 	@time_execution_async('--get_cross_origin_iframes')
 	async def get_cross_origin_iframes(self) -> list[str]:
 		# invisible cross-origin iframes are used for ads and tracking, dont open those
-		hidden_frame_urls = await self.page.locator('iframe').filter(visible=False).evaluate_all('e => e.map(e => e.src)')
-
-		is_ad_url = lambda url: any(
-			domain in urlparse(url).netloc for domain in ('doubleclick.net', 'adroll.com', 'googletagmanager.com')
-		)
-
-		return [
-			frame.url
-			for frame in self.page.frames
-			if urlparse(frame.url).netloc  # exclude data:urls and about:blank
-			and urlparse(frame.url).netloc != urlparse(self.page.url).netloc  # exclude same-origin iframes
-			and frame.url not in hidden_frame_urls  # exclude hidden frames
-			and not is_ad_url(frame.url)  # exclude most common ad network tracker frame URLs
-		]
+		hidden_frame_urls = set(await self.page.locator('iframe').filter(visible=False).evaluate_all('e => e.map(e => e.src)'))
+
+		# parse each url once instead of re-parsing the page url and frame url for every condition
+		page_netloc = urlparse(self.page.url).netloc
+		cross_origin_frame_urls = []
+		for frame in self.page.frames:
+			frame_netloc = urlparse(frame.url).netloc
+			if (
+				frame_netloc  # exclude data:urls and about:blank
+				and frame_netloc != page_netloc  # exclude same-origin iframes
+				and frame.url not in hidden_frame_urls  # exclude hidden frames
+				# exclude most common ad network tracker frame URLs
+				and not any(domain in frame_netloc for domain in AD_TRACKER_DOMAINS)
+			):
+				cross_origin_frame_urls.append(frame.url)
+		return cross_origin_frame_urls
 
 	@time_execution_async('--build_dom_tree')
 	async def _build_dom_tree(
@@ -69,9 +83,6 @@ class DomService:
 		focus_element: int,
 		viewport_expansion: int,
 	) -> tuple[DOMElementNode, SelectorMap]:
-		if await self.page.evaluate('1+1') != 2:
-			raise ValueError('The page cannot evaluate javascript code properly')
-
 		if self.page.url == 'about:blank':
 			# short-circuit if the page is a new empty tab for speed, no need to inject buildDomTree.js
 			return (
@@ -103,6 +114,10 @@ class DomService:
 			self.logger.error('Error evaluating JavaScript: %s', e)
 			raise
 
+		# validate the result instead of probing the page with a separate evaluate beforehand
+		if not isinstance(eval_page, dict) or 'map' not in eval_page or 'rootId' not in eval_page:
+			raise ValueError('The page cannot evaluate javascript code properly')
+
 		# Only log performance metrics in debug mode
 		if debug_mode and 'perfMetrics' in eval_page:
 			perf = eval_page['perfMetrics']
@@ -134,6 +149,14 @@ class DomService:
 	async def _construct_dom_tree(
 		self,
 		eval_page: dict,
+	) -> tuple[DOMElementNode, SelectorMap]:
+		# building thousands of node objects is pure CPU work, run it in a worker thread
+		# so it doesn't block the event loop (and any other pages/frames being handled on it)
+		return await asyncio.to_thread(self._construct_dom_tree_sync, eval_page)
+
+	def _construct_dom_tree_sync(
+		self,
+		eval_page: dict,
 	) -> tuple[DOMElementNode, SelectorMap]:
 		js_node_map = eval_page['map']
 		js_root_id = eval_page['rootId']
@@ -148,20 +171,18 @@ class DomService:
 
 			node_map[id] = node
 
-			if isinstance(node, DOMElementNode) and node.highlight_index is not None:
+			# text nodes have no highlight index or children, so check the node type once and skip them early
+			if not isinstance(node, DOMElementNode):
+				continue
+
+			if node.highlight_index is not None:
 				selector_map[node.highlight_index] = node
 
 			# NOTE: We know that we are building the tree bottom up
 			#       and all children are already processed.
-			if isinstance(node, DOMElementNode):
-				for child_id in children_ids:
-					if child_id not in node_map:
-						continue
-
-					child_node = node_map[child_id]
-
-					child_node.parent = node
-					node.children.append(child_node)
+			node.children = [node_map[child_id] for child_id in children_ids if child_id in node_map]
+			for child_node in node.children:
+				child_node.parent = node
 
 		html_to_dict = node_map[str(js_root_id)]
 
@@ -194,16 +215,21 @@ class DomService:
 
 		viewport_info = None
 
-		if 'viewport' in node_data:
+		viewport = node_data.get('viewport')
+		if viewport is not None:
 			viewport_info = ViewportInfo(
-				width=node_data['viewport']['width'],
-				height=node_data['viewport']['height'],
+				width=viewport['width'],
+				height=viewport['height'],
 			)
 
+		# a page only uses a handful of distinct tag names and attribute keys, intern them so the
+		# thousands of nodes share one string object each instead of a fresh copy per node
+		attributes = {sys.intern(key): value for key, value in node_data.get('attributes', {}).items()}
+
 		element_node = DOMElementNode(
-			tag_name=node_data['tagName'],
+			tag_name=sys.intern(node_data['tagName']),
 			xpath=node_data['xpath'],
-			attributes=node_data.get('attributes', {}),
+			attributes=attributes,
 			children=[],
 			is_visible=node_data.get('isVisible', False),
 			is_interactive=node_data.get('isInteractive', False),
@@ -10,7 +10,11 @@ if TYPE_CHECKING:
 	from .views import DOMElementNode
 
 
-@dataclass(frozen=False)
+# Text nodes make up a large share of every page's tree, so the base and text node classes use
+# __slots__ (no per-instance __dict__). DOMElementNode keeps its __dict__ for the cached `hash` property.
+# Nodes compare by identity (eq=False): the generated field-by-field __eq__ would recurse through
+# parent/children on every `node in list` check, and "same node object" is what callers mean anyway.
+@dataclass(frozen=False, slots=True, eq=False)
 class DOMBaseNode:
 	is_visible: bool
 	# Use None as default and set parent later to avoid circular reference issues
@@ -20,7 +24,7 @@ class DOMBaseNode:
 		raise NotImplementedError('DOMBaseNode is an abstract class')
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True, eq=False)
 class DOMTextNode(DOMBaseNode):
 	text: str
 	type: str = 'TEXT_NODE'
@@ -52,7 +56,7 @@ class DOMTextNode(DOMBaseNode):
 		}
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, eq=False)
 class DOMElementNode(DOMBaseNode):
 	"""
 	xpath: the xpath of the element from the last root node (shadow root or iframe OR document if no shadow root or iframe).
@@ -80,6 +84,21 @@ class DOMElementNode(DOMBaseNode):
 	is_new: bool | None = None
 
 	def __json__(self) -> dict:
+		# Iterative walk so very deep trees don't hit the interpreter recursion limit
+		result = self._shallow_json()
+		stack: list[tuple[DOMElementNode, list[dict]]] = [(self, result['children'])]
+		while stack:
+			node, json_children = stack.pop()
+			for child in node.children:
+				if isinstance(child, DOMElementNode):
+					child_json = child._shallow_json()
+					stack.append((child, child_json['children']))
+				else:
+					child_json = child.__json__()
+				json_children.append(child_json)
+		return result
+
+	def _shallow_json(self) -> dict:
 		return {
 			'tag_name': self.tag_name,
 			'xpath': self.xpath,
@@ -92,7 +111,7 @@ class DOMElementNode(DOMBaseNode):
 			'highlight_index': self.highlight_index,
 			'viewport_coordinates': self.viewport_coordinates,
 			'page_coordinates': self.page_coordinates,
-			'children': [child.__json__() for child in self.children],
+			'children': [],
 		}
 
 	def __repr__(self) -> str:
@@ -132,21 +151,22 @@ class DOMElementNode(DOMBaseNode):
 	def get_all_text_till_next_clickable_element(self, max_depth: int = -1) -> str:
 		text_parts = []
 
-		def collect_text(node: DOMBaseNode, current_depth: int) -> None:
+		# Explicit stack instead of a recursive closure (pre-order, children pushed in reverse to keep document order)
+		stack: list[tuple[DOMBaseNode, int]] = [(self, 0)]
+		while stack:
+			node, current_depth = stack.pop()
 			if max_depth != -1 and current_depth > max_depth:
-				return
+				continue
 
 			# Skip this branch if we hit a highlighted element (except for the current node)
-			if isinstance(node, DOMElementNode) and node != self and node.highlight_index is not None:
-				return
+			if isinstance(node, DOMElementNode) and node is not self and node.highlight_index is not None:
+				continue
 
 			if isinstance(node, DOMTextNode):
 				text_parts.append(node.text)
 			elif isinstance(node, DOMElementNode):
-				for child in node.children:
-					collect_text(child, current_depth + 1)
+				stack.extend((child, current_depth + 1) for child in reversed(node.children))
 
-		collect_text(self, 0)
 		return '\n'.join(text_parts).strip()
 
 	@time_execution_sync('--clickable_elements_to_string')
@@ -154,8 +174,12 @@ class DOMElementNode(DOMBaseNode):
 		"""Convert the processed DOM content to HTML."""
 		formatted_text = []
 
-		def process_node(node: DOMBaseNode, depth: int) -> None:
-			next_depth = int(depth)
+		# Walk the tree with an explicit stack (pre-order, same as the old recursive version)
+		# so deeply nested pages don't pay per-node call overhead or hit the recursion limit
+		stack: list[tuple[DOMBaseNode, int]] = [(self, 0)]
+		while stack:
+			node, depth = stack.pop()
+			next_depth = depth
 			depth_str = depth * '\t'
 
 			if isinstance(node, DOMElementNode):
@@ -175,18 +199,15 @@ class DOMElementNode(DOMBaseNode):
 						if node.tag_name == attributes_to_include.get('role'):
 							del attributes_to_include['role']
 
+						# (text is already stripped by get_all_text_till_next_clickable_element, no need to strip it again)
 						# if aria-label == text of the node, don't include it
-						if (
-							attributes_to_include.get('aria-label')
-							and attributes_to_include.get('aria-label', '').strip() == text.strip()
-						):
+						aria_label = attributes_to_include.get('aria-label')
+						if aria_label and aria_label.strip() == text:
 							del attributes_to_include['aria-label']
 
 						# if placeholder == text of the node, don't include it
-						if (
-							attributes_to_include.get('placeholder')
-							and attributes_to_include.get('placeholder', '').strip() == text.strip()
-						):
+						placeholder = attributes_to_include.get('placeholder')
+						if placeholder and placeholder.strip() == text:
 							del attributes_to_include['placeholder']
 
 						if attributes_to_include:
@@ -216,9 +237,8 @@ class DOMElementNode(DOMBaseNode):
 					line += ' />'  # 1 token
 					formatted_text.append(line)
 
-				# Process children regardless
-				for child in node.children:
-					process_node(child, next_depth)
+				# Process children regardless, pushed in reverse so they pop in document order
+				stack.extend((child, next_depth) for child in reversed(node.children))
 
 			elif isinstance(node, DOMTextNode):
 				# Add text only if it doesn't have a highlighted parent
@@ -227,7 +247,6 @@ class DOMElementNode(DOMBaseNode):
 				):  # and node.is_parent_top_element()
 					formatted_text.append(f'{depth_str}{node.text}')
 
-		process_node(self, 0)
 		return '\n'.join(formatted_text)
 
 
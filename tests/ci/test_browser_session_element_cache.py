@@ -57,9 +57,9 @@ def httpserver(make_httpserver):
 	return server
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 async def browser_session():
-	"""Create a real browser session for testing."""
+	"""Create a real browser session shared by all tests in this module (each test navigates to its own page first)."""
 	session = BrowserSession(
 		browser_profile=BrowserProfile(
 			user_data_dir=None,  # Use temporary profile
@@ -82,7 +82,6 @@ async def test_assumption_1_dom_processing_works(browser_session, httpserver):
 	# Go to a simple page
 	page = await browser_session.get_current_page()
 	await page.goto(httpserver.url_for('/'))
-	await page.wait_for_load_state()
 
 	# Trigger DOM processing
 	state = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
@@ -102,7 +101,6 @@ async def test_assumption_2_cached_selector_map_persists(browser_session, httpse
 	# Go to a simple page
 	page = await browser_session.get_current_page()
 	await page.goto(httpserver.url_for('/'))
-	await page.wait_for_load_state()
 
 	# Trigger DOM processing and cache
 	state = await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
@@ -127,7 +125,6 @@ async def test_assumption_3_action_gets_same_selector_map(browser_session, contr
 	# Go to a simple page
 	page = await browser_session.get_current_page()
 	await page.goto(httpserver.url_for('/'))
-	await page.wait_for_load_state()
 
 	# Trigger DOM processing and cache
 	await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
@@ -163,7 +160,6 @@ async def test_assumption_4_click_action_specific_issue(browser_session, control
 	# Go to a simple page
 	page = await browser_session.get_current_page()
 	await page.goto(httpserver.url_for('/'))
-	await page.wait_for_load_state()
 
 	# Trigger DOM processing and cache
 	await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
@@ -211,7 +207,6 @@ async def test_assumption_5_multiple_get_selector_map_calls(browser_session, htt
 	# Go to a simple page
 	page = await browser_session.get_current_page()
 	await page.goto(httpserver.url_for('/'))
-	await page.wait_for_load_state()
 
 	# Trigger DOM processing and cache
 	await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
@@ -238,7 +233,6 @@ async def test_assumption_6_page_changes_affect_selector_map(browser_session, ht
 	# Go to first page
 	page = await browser_session.get_current_page()
 	await page.goto(httpserver.url_for('/'))
-	await page.wait_for_load_state()
 
 	# Get initial selector map
 	await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
@@ -249,7 +243,6 @@ async def test_assumption_6_page_changes_affect_selector_map(browser_session, ht
 
 	# Navigate to a different page (without calling get_state_summary)
 	await page.goto(httpserver.url_for('/page1'))
-	await page.wait_for_load_state()
 
 	# Check if cached selector map is still from old page
 	cached_map_after_nav = await browser_session.get_selector_map()
@@ -275,7 +268,6 @@ async def test_assumption_8_same_browser_session_instance(browser_session, contr
 	# Go to a simple page
 	page = await browser_session.get_current_page()
 	await page.goto(httpserver.url_for('/'))
-	await page.wait_for_load_state()
 
 	print('=== BROWSER SESSION INSTANCE DEBUG ===')
 
@@ -320,7 +312,6 @@ async def test_assumption_9_pydantic_private_attrs(browser_session, controller,
 	# Go to a simple page
 	page = await browser_session.get_current_page()
 	await page.goto(httpserver.url_for('/'))
-	await page.wait_for_load_state()
 
 	print('=== PYDANTIC PRIVATE ATTRS DEBUG ===')
 
@@ -382,7 +373,6 @@ async def test_assumption_7_cache_gets_cleared(browser_session, controller, http
 	# Go to a simple page
 	page = await browser_session.get_current_page()
 	await page.goto(httpserver.url_for('/'))
-	await page.wait_for_load_state()
 
 	print('=== CACHE CLEARING DEBUG ===')
 
@@ -449,7 +439,6 @@ async def test_final_real_click_with_debug(browser_session, controller, httpserv
 	# Go to a simple page
 	page = await browser_session.get_current_page()
 	await page.goto(httpserver.url_for('/'))
-	await page.wait_for_load_state()
 
 	print('=== FINAL CLICK TEST WITH FULL DEBUG ===')
 
@@ -323,3 +323,36 @@ class TestBrowserSessionFileUploads:
 		invalid_index = max(selector_map.keys()) + 100 if selector_map else 999
 		file_input = await browser_session.find_file_upload_element_by_index(invalid_index)
 		assert file_input is None
+
+	async def test_file_input_inside_hidden_wrapper(self, browser_session: BrowserSession, test_server: HTTPServer):
+		"""Test that a file input nested inside a display:none wrapper is still found from its upload button."""
+		html = """
+		<!DOCTYPE html>
+		<html>
+		<body>
+			<div class="uploader">
+				<button class="hidden-wrapper-button">Upload resume</button>
+				<div class="hidden-wrapper" style="display: none;">
+					<span>Supported formats: pdf, docx</span>
+					<input type="file" id="wrapped-file" accept=".pdf,.docx">
+				</div>
+			</div>
+		</body>
+		</html>
+		"""
+
+		test_server.expect_request('/hidden-wrapper').respond_with_data(html, content_type='text/html')
+		await browser_session.start()
+		page = await browser_session.get_current_page()
+		await page.goto(test_server.url_for('/hidden-wrapper'))
+		await page.wait_for_load_state('networkidle')
+
+		# Get browser state to populate selector map
+		await browser_session.get_state_summary(cache_clickable_elements_hashes=False)
+
+		selector_map = await browser_session.get_selector_map()
+		button_idx = next(idx for idx, elem in selector_map.items() if elem.attributes.get('class') == 'hidden-wrapper-button')
+
+		file_input = await browser_session.find_file_upload_element_by_index(button_idx)
+		assert file_input is not None
+		assert file_input.attributes.get('id') == 'wrapped-file'
@@ -269,7 +269,9 @@ class TestBrowserProfileRecordings:
 		await browser_session.start()
 		try:
 			await browser_session.navigate(httpserver_url)
-			await asyncio.sleep(0.5)
+			# wait for the page's requests to finish instead of sleeping a fixed amount
+			page = await browser_session.get_current_page()
+			await page.wait_for_load_state()
 		finally:
 			await browser_session.stop()
 
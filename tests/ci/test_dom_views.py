@@ -0,0 +1,230 @@
+"""Tests for the DOM tree views (DOMElementNode / DOMTextNode) built from buildDomTree.js output, and the processors walking them."""
+
+import pytest
+
+from browser_use.dom.clickable_element_processor.service import ClickableElementProcessor
+from browser_use.dom.history_tree_processor.service import HistoryTreeProcessor
+from browser_use.dom.views import DOMElementNode, DOMTextNode
+
+
+def _element(tag_name: str, children: list | None = None, **kwargs) -> DOMElementNode:
+	"""Build an element node and wire up the parent pointers of its children"""
+	kwargs.setdefault('is_visible', True)
+	kwargs.setdefault('is_top_element', True)
+	node = DOMElementNode(
+		tag_name=tag_name,
+		xpath=kwargs.pop('xpath', tag_name),
+		attributes=kwargs.pop('attributes', {}),
+		children=children or [],
+		parent=None,
+		**kwargs,
+	)
+	for child in node.children:
+		child.parent = node
+	return node
+
+
+def _text(text: str) -> DOMTextNode:
+	return DOMTextNode(text=text, is_visible=True, parent=None)
+
+
+DEEP_TREE_DEPTH = 5000  # well past the default interpreter recursion limit of 1000
+
+
+def _deep_tree() -> tuple[DOMElementNode, DOMElementNode]:
+	"""Build a tree nested DEEP_TREE_DEPTH divs deep, returning (root, the highlighted button at the bottom)"""
+	button = _element('button', [_text('Deep button')], xpath='html/body/p/button', highlight_index=1)
+	node = _element('p', [_text('Deep text'), button])
+	for _ in range(DEEP_TREE_DEPTH):
+		node = _element('div', [node])
+	return node, button
+
+
+def _deepest_json(root: DOMElementNode) -> dict:
+	result = root.__json__()
+	for _ in range(DEEP_TREE_DEPTH):
+		result = result['children'][0]
+	return result
+
+
+class TestNodeIdentity:
+	"""Test that DOM nodes compare by identity."""
+
+	def test_structurally_equal_nodes_are_distinct(self):
+		"""Two nodes with the same fields are still different nodes, and nodes are hashable."""
+		first = _element('button', [_text('Same')], highlight_index=0)
+		second = _element('button', [_text('Same')], highlight_index=0)
+
+		assert first != second
+		assert first in [first] and second not in [first]
+		assert len({first, second, first.children[0], second.children[0]}) == 4
+
+
+class TestClickableElementsToString:
+	"""Test the LLM-facing serialization of the DOM tree."""
+
+	def test_document_order_and_indentation(self):
+		"""Highlighted elements are emitted in document order, indented by highlighted depth."""
+		tree = _element(
+			'body',
+			[
+				_text('Header text'),
+				_element(
+					'div',
+					[
+						_element('button', [_text('First')], highlight_index=0),
+						_element(
+							'a', [_text('Second'), _element('span', [_element('img', highlight_index=2)])], highlight_index=1
+						),
+					],
+				),
+				_element('input', attributes={'type': 'text', 'name': 'q'}, highlight_index=3),
+				_text('Footer text'),
+			],
+		)
+
+		result = tree.clickable_elements_to_string(include_attributes=['type'])
+
+		assert result.split('\n') == [
+			'Header text',
+			'[0]<button >First />',
+			'[1]<a >Second />',
+			'\t[2]<img  />',
+			"[3]<input type='text' />",
+			'Footer text',
+		]
+
+	def test_attributes_matching_text_are_dropped(self):
+		"""aria-label / placeholder that just repeat the element text are left out."""
+		tree = _element(
+			'div',
+			[
+				_element('button', [_text('Search')], attributes={'aria-label': ' Search '}, highlight_index=0),
+				_element('button', [_text('Go')], attributes={'aria-label': 'Submit form'}, highlight_index=1),
+			],
+		)
+
+		result = tree.clickable_elements_to_string(include_attributes=['aria-label', 'placeholder'])
+
+		assert result.split('\n') == [
+			'[0]<button >Search />',
+			"[1]<button aria-label='Submit form'>Go />",
+		]
+
+
+class TestJsonSerialization:
+	"""Test the dict representation of the DOM tree."""
+
+	def test_children_in_document_order(self):
+		"""Children are serialized recursively, in document order."""
+		tree = _element('div', [_text('Hello'), _element('a', [_text('Link')], attributes={'href': '/x'}, highlight_index=0)])
+
+		result = tree.__json__()
+
+		assert result['tag_name'] == 'div'
+		assert result['children'][0] == {'text': 'Hello', 'type': 'TEXT_NODE'}
+		link = result['children'][1]
+		assert (link['tag_name'], link['attributes'], link['highlight_index']) == ('a', {'href': '/x'}, 0)
+		assert link['children'] == [{'text': 'Link', 'type': 'TEXT_NODE'}]
+
+
+class TestGetAllTextTillNextClickableElement:
+	"""Test collecting the text that belongs to an element."""
+
+	def test_stops_at_nested_highlighted_elements(self):
+		"""Text is collected in document order and nested highlighted elements are skipped."""
+		node = _element(
+			'label',
+			[
+				_text('Before'),
+				_element('span', [_text('Inside span')]),
+				_element('button', [_text('Other button')], highlight_index=1),
+				_text('After'),
+			],
+			highlight_index=0,
+		)
+
+		assert node.get_all_text_till_next_clickable_element() == 'Before\nInside span\nAfter'
+
+	def test_max_depth(self):
+		"""Only text up to max_depth levels below the element is collected."""
+		node = _element('div', [_text('Direct'), _element('span', [_text('Nested')])])
+
+		assert node.get_all_text_till_next_clickable_element(max_depth=1) == 'Direct'
+		assert node.get_all_text_till_next_clickable_element() == 'Direct\nNested'
+
+
+class TestClickableElementProcessor:
+	"""Test collecting the highlighted elements of a tree."""
+
+	def test_get_clickable_elements_in_document_order(self):
+		"""Highlighted elements are returned parent-first in document order, including nested ones."""
+		first = _element('button', [_text('First')], highlight_index=1)
+		inner = _element('img', highlight_index=3)
+		second = _element('a', [_element('span', [inner])], highlight_index=2)
+		last = _element('input', highlight_index=4)
+		tree = _element('body', [_element('div', [first, second]), _text('Some text'), last])
+
+		assert ClickableElementProcessor.get_clickable_elements(tree) == [first, second, inner, last]
+
+
+class TestHistoryTreeProcessor:
+	"""Test re-finding elements from a previous step in a freshly built tree."""
+
+	@staticmethod
+	def _build_tree(depth: int = 0) -> tuple[DOMElementNode, DOMElementNode]:
+		target = _element('button', [_text('Go')], attributes={'id': 'go'}, xpath='html/body/div/button', highlight_index=2)
+		node = _element('div', [_element('a', xpath='html/body/div/a', highlight_index=1), target], xpath='html/body/div')
+		for _ in range(depth):
+			node = _element('div', [node])
+		return _element('body', [node], xpath='html/body'), target
+
+	def test_find_history_element_in_new_tree(self):
+		"""An element recorded in history is found again in a rebuilt tree with the same structure."""
+		_, old_target = self._build_tree()
+		history_element = HistoryTreeProcessor.convert_dom_element_to_history_element(old_target)
+
+		new_tree, new_target = self._build_tree()
+		assert HistoryTreeProcessor.find_history_element_in_tree(history_element, new_tree) is new_target
+
+		changed_tree, _ = self._build_tree(depth=1)
+		assert HistoryTreeProcessor.find_history_element_in_tree(history_element, changed_tree) is None
+
+
+class TestDeepTrees:
+	"""Test that the tree walkers don't hit the interpreter recursion limit on very deep trees."""
+
+	@pytest.mark.parametrize(
+		'walk_is_correct',
+		[
+			pytest.param(
+				lambda root, button: _deepest_json(root)['children'][0] == {'text': 'Deep text', 'type': 'TEXT_NODE'},
+				id='__json__',
+			),
+			pytest.param(
+				lambda root, button: root.clickable_elements_to_string() == 'Deep text\n[1]<button >Deep button />',
+				id='clickable_elements_to_string',
+			),
+			pytest.param(
+				lambda root, button: root.get_all_text_till_next_clickable_element() == 'Deep text',
+				id='get_all_text_till_next_clickable_element',
+			),
+			pytest.param(
+				lambda root, button: ClickableElementProcessor.get_clickable_elements(root) == [button],
+				id='get_clickable_elements',
+			),
+			pytest.param(
+				lambda root, button: (
+					HistoryTreeProcessor.find_history_element_in_tree(
+						HistoryTreeProcessor.convert_dom_element_to_history_element(button), root
+					)
+					is button
+				),
+				id='find_history_element_in_tree',
+			),
+		],
+	)
+	def test_deeply_nested_tree(self, walk_is_correct):
+		root, button = _deep_tree()
+
+		assert walk_is_correct(root, button)
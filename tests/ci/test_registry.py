@@ -33,8 +33,6 @@ from browser_use.controller.views import (
 from browser_use.llm.messages import UserMessage
 from tests.ci.conftest import create_mock_llm
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 